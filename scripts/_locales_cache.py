@@ -0,0 +1,256 @@
+#!/usr/bin/env python3
+"""
+Parsed-locale cache shared by the add-*-keys scripts.
+
+Each script used to json.load every locale file on every run. load_all()
+keeps the parsed trees in a pickle cache (scripts/.locales.cache.pkl) and
+only re-parses a file when its content hash differs. save_all() writes back
+just the files a script actually modified.
+
+Callers must pass every locale they mutated to save_all(), otherwise the
+cache would hold a tree that no longer matches the file on disk.
+"""
+import hashlib
+import json
+import mmap
+import os
+import pickle
+import stat
+import sys
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    import orjson
+except ImportError:  # stdlib fallback, same output
+    orjson = None
+
+LOCALES_DIR = os.path.join(os.path.dirname(__file__), '..', 'src', 'i18n', 'locales')
+# Kept next to the scripts, not in the locales dir: tooling and bundlers
+# glob that directory. One file for every locales dir, keyed by file path.
+CACHE_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), '.locales.cache.pkl')
+MAX_WORKERS = 8
+
+# Per-directory state: {locales_dir: {path: (mtime_ns, size, digest, data)}}
+_entries = {}
+
+
+def loads(raw):
+    """Parse JSON from bytes or any buffer (orjson reads memoryviews without copying)."""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(bytes(raw))
+
+
+def load_json(path):
+    """Parse a JSON file (a locale or a translations table) read in one call."""
+    with open(path, 'rb') as f:
+        return loads(f.read())
+
+
+def dump_locale(data, compact=False, newline=False):
+    """Serialize a locale tree as UTF-8 bytes.
+
+    Same bytes as json.dumps(ensure_ascii=False, indent=2), or with no
+    whitespace at all when `compact`; `newline` appends a trailing newline.
+    """
+    if orjson is not None:
+        option = 0 if compact else orjson.OPT_INDENT_2
+        if newline:
+            option |= orjson.OPT_APPEND_NEWLINE
+        return orjson.dumps(data, option=option)
+    if compact:
+        text = json.dumps(data, ensure_ascii=False, separators=(',', ':'))
+    else:
+        text = json.dumps(data, ensure_ascii=False, indent=2)
+    return (text + '\n' if newline else text).encode('utf-8')
+
+
+def intern_strings(tree):
+    """Replace every string leaf of a nested dict with its sys.intern() copy, in place.
+
+    Translations repeated across locales ("Pause", "Manitoba", ...) then share
+    a single object.
+    """
+    for key, value in tree.items():
+        if isinstance(value, str):
+            tree[key] = sys.intern(value)
+        elif isinstance(value, dict):
+            intern_strings(value)
+    return tree
+
+
+def encode_member(key, value):
+    """Pre-encode one top-level string member as b'"key": "value"' for splice_members()."""
+    return (json.dumps(key, ensure_ascii=False) + ': ' + json.dumps(value, ensure_ascii=False)).encode('utf-8')
+
+
+def _splice(path, members):
+    """Insert pre-encoded top-level members before the closing brace of an indent=2 file.
+
+    The rest of the file is left byte-for-byte untouched. Returns the new
+    payload, or None when the file does not have the expected layout.
+    """
+    with open(path, 'rb') as f:
+        raw = f.read()
+    end = raw.rfind(b'\n}')
+    last_line = raw[raw.rfind(b'\n', 0, end) + 1:end]
+    if end <= 0 or raw[end + 2:].strip() or not last_line.startswith(b'  "'):
+        return None
+    return raw[:end] + b''.join(b',\n  ' + m for m in members) + raw[end:]
+
+
+def write_atomic(path, payload, fsync=False):
+    """Write bytes to `path` via a sibling temp file and os.replace().
+
+    Readers see either the old or the new file, never a partial write, and
+    no fsync is needed for that guarantee. fsync=True additionally flushes
+    the data to disk before the rename and the directory entry after it,
+    for writes that must survive a power loss. The file keeps its mode.
+    """
+    try:
+        mode = stat.S_IMODE(os.stat(path).st_mode)
+    except FileNotFoundError:
+        mode = 0o644
+    # Unique temp name: concurrent writers of the same file never share one
+    fd, tmp = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(path)),
+                               prefix=os.path.basename(path) + '.', suffix='.tmp')
+    try:
+        try:
+            # Raw fd, no Python-level buffering: normally a single write() syscall
+            view = memoryview(payload)
+            while view:
+                view = view[os.write(fd, view):]
+            os.fchmod(fd, mode)
+            if fsync:
+                os.fsync(fd)
+        finally:
+            os.close(fd)
+        os.replace(tmp, path)
+    except BaseException:
+        # e.g. ENOSPC: do not leave the temp file behind
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+        raise
+    if fsync:
+        # The rename lives in the directory; persist it too
+        dir_fd = os.open(os.path.dirname(os.path.abspath(path)), os.O_RDONLY)
+        try:
+            os.fsync(dir_fd)
+        finally:
+            os.close(dir_fd)
+
+
+def _map(path, size):
+    """Read-only mmap of a file (an empty bytes object for empty files)."""
+    if size == 0:
+        return b''
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        return mmap.mmap(fd, 0, access=mmap.ACCESS_READ)
+    finally:
+        os.close(fd)
+
+
+def _load_cache():
+    try:
+        with open(CACHE_FILE, 'rb') as f:
+            return pickle.load(f)
+    except (OSError, EOFError, pickle.UnpicklingError):
+        return {}
+
+
+def _save_cache(locales_dir, entries):
+    # Replace this directory's entries, keep those of other locales dirs
+    cache = {path: entry for path, entry in _load_cache().items() if os.path.dirname(path) != locales_dir}
+    # Files skipped without parsing have no tree to cache yet
+    cache.update((path, entry) for path, entry in entries.items() if entry[3] is not None)
+    write_atomic(CACHE_FILE, pickle.dumps(cache, protocol=pickle.HIGHEST_PROTOCOL))
+
+
+def _load_one(entry, hit, skip):
+    """Cache entry for one DirEntry, reusing `hit` when the file is unchanged.
+
+    The content hash is always checked: an in-place edit of the same size
+    within the filesystem's timestamp granularity keeps mtime and size, and
+    serving the cached tree would let save_all() overwrite that edit.
+    Hashing the mapping is cheap next to a parse.
+
+    The parsed tree is None when `skip` decided from the raw bytes alone that
+    the file needs no change. `skip` gets the read-only mapping, which
+    supports find() like bytes.
+    """
+    st = entry.stat()
+    # Hash, pre-scan and parse all run over the same zero-copy mapping
+    raw = _map(entry.path, st.st_size)
+    try:
+        digest = hashlib.blake2b(raw).hexdigest()
+        if hit and hit[2] == digest:
+            return (st.st_mtime_ns, st.st_size, digest, hit[3])
+        if skip is not None and skip(locale_of(entry.path), raw):
+            return (st.st_mtime_ns, st.st_size, digest, None)
+        with memoryview(raw) as view:
+            return (st.st_mtime_ns, st.st_size, digest, loads(view))
+    finally:
+        if isinstance(raw, mmap.mmap):
+            raw.close()
+
+
+def _save_one(path, data, members):
+    payload = _splice(path, members) if members is not None else None
+    if payload is None:
+        payload = dump_locale(data, newline=True)
+    write_atomic(path, payload)
+    st = os.stat(path)
+    return (st.st_mtime_ns, st.st_size, hashlib.blake2b(payload).hexdigest(), data)
+
+
+def _pool(n):
+    return ThreadPoolExecutor(max_workers=max(1, min(MAX_WORKERS, n)))
+
+
+def load_all(locales_dir=LOCALES_DIR, skip=None):
+    """Return {filepath: parsed_dict} for every *.json locale, sorted by name.
+
+    `skip(locale, raw)` may return True for a file that is known to need
+    no change; such files are left unparsed and omitted from the result.
+    """
+    locales_dir = os.path.abspath(locales_dir)
+    cached = _load_cache()
+
+    with os.scandir(locales_dir) as it:
+        files = sorted((e for e in it if e.name.endswith('.json')), key=lambda e: e.name)
+
+    # Files are independent; reads and orjson parsing overlap across threads
+    with _pool(len(files)) as ex:
+        loaded = list(ex.map(lambda e: _load_one(e, cached.get(e.path), skip), files))
+
+    entries = {e.path: entry for e, entry in zip(files, loaded)}
+    _entries[locales_dir] = entries
+    return {path: entry[3] for path, entry in entries.items() if entry[3] is not None}
+
+
+def save_all(dirty, locales_dir=LOCALES_DIR, members=None):
+    """Write back the locale files in `dirty` (paths from load_all) and refresh the cache.
+
+    `members` optionally maps a path to the pre-encoded top-level members that
+    were appended to its tree; those files are patched in place instead of
+    being re-serialized whenever their layout allows it.
+    """
+    locales_dir = os.path.abspath(locales_dir)
+    entries = _entries[locales_dir]
+    members = members or {}
+    dirty = list(dirty)
+
+    with _pool(len(dirty)) as ex:
+        saved = list(ex.map(lambda p: _save_one(p, entries[p][3], members.get(p)), dirty))
+    entries.update(zip(dirty, saved))
+
+    _save_cache(locales_dir, entries)
+
+
+def locale_of(path):
+    """'.../locales/ar-dz.json' -> 'ar-dz'"""
+    return os.path.splitext(os.path.basename(path))[0]
@@ -5,14 +5,11 @@
 - Payment error messages
 - SMS notifications
 """
-import json
-import os
-import glob
-
-LOCALES_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'src', 'i18n', 'locales')
+from _locales_cache import intern_strings
+from add_all_keys import apply_key_sets
 
 # New keys to add (en + fr)
-NEW_KEYS = {
+CHECKOUT_KEYS = {
     "checkout.billingAddress": {
         "en": "Billing Address",
         "fr": "Adresse de facturation"
@@ -91,9 +88,13 @@ NEW_KEYS = {
     },
 }
 
-def set_nested(d, key_path, value):
-    """Set a value in a nested dict using dot notation."""
-    keys = key_path.split('.')
+intern_strings(CHECKOUT_KEYS)
+
+# Dot paths split once at import instead of once per (locale, key)
+CHECKOUT_KEYS_SPLIT = [(tuple(key.split('.')), translations) for key, translations in CHECKOUT_KEYS.items()]
+
+def set_nested(d, keys, value):
+    """Set a value in a nested dict from a tuple of path segments."""
     for k in keys[:-1]:
         if k not in d:
             d[k] = {}
@@ -103,36 +104,31 @@ def set_nested(d, key_path, value):
         return True
     return False
 
-def main():
-    locale_files = sorted(glob.glob(os.path.join(LOCALES_DIR, '*.json')))
-    total_added = 0
+def apply_keys(data, locale):
+    """Add the checkout keys to a parsed locale tree, returning how many were added."""
+    added = 0
+    for keys, translations in CHECKOUT_KEYS_SPLIT:
+        if locale == 'fr':
+            value = translations['fr']
+        elif locale == 'en':
+            value = translations['en']
+        else:
+            value = translations['en']  # English fallback, daemon translates
 
-    for filepath in locale_files:
-        locale = os.path.splitext(os.path.basename(filepath))[0]
+        if set_nested(data, keys, value):
+            added += 1
+    return added
 
-        with open(filepath, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-
-        added = 0
-        for key, translations in NEW_KEYS.items():
-            if locale == 'fr':
-                value = translations['fr']
-            elif locale == 'en':
-                value = translations['en']
-            else:
-                value = translations['en']  # English fallback, daemon translates
-
-            if set_nested(data, key, value):
-                added += 1
+def main():
+    results = apply_key_sets([apply_keys])
+    total_added = 0
 
+    for locale, (added,) in results:
         if added > 0:
-            with open(filepath, 'w', encoding='utf-8') as f:
-                json.dump(data, f, ensure_ascii=False, indent=2)
-                f.write('\n')
             print(f"  {locale}: +{added} keys")
             total_added += added
 
-    print(f"\nTotal: {total_added} keys added across {len(locale_files)} locales")
+    print(f"\nTotal: {total_added} keys added across {len(results)} locales")
 
 if __name__ == '__main__':
     main()
@@ -3,14 +3,14 @@
 Add missing i18n keys to all 22 locale files.
 English values used for all non-fr locales (daemon will translate tonight).
 """
-import json
 import os
 
-LOCALES_DIR = os.path.join(os.path.dirname(__file__), '..', 'src', 'i18n', 'locales')
+from _locales_cache import LOCALES_DIR, intern_strings
+from add_all_keys import apply_key_sets
 
 # Keys to add: { "namespace.key": {"en": "...", "fr": "..."} }
 # For nested keys use dot notation: "calculator.inVial" -> calculator: { inVial: "..." }
-NEW_KEYS = {
+I18N_KEYS = {
     # Calculator sub-keys (extend existing calculator section)
     "calculator.inVial": {"en": "in the vial", "fr": "dans le vial"},
     "calculator.bacteriostaticWater": {"en": "bacteriostatic water", "fr": "eau bactériostatique"},
@@ -141,9 +141,18 @@ NEW_KEYS = {
 }
 
 
-def set_nested(data, dotpath, value):
-    """Set a nested key in a dict using dot notation."""
-    keys = dotpath.split('.')
+intern_strings(I18N_KEYS)
+
+# (dotpath, split path, en, fr) records resolved once at import instead of
+# splitting the path and looking up the value once per (locale, key)
+I18N_KEYS_RECORDS = tuple(
+    (dotpath, tuple(dotpath.split('.')), t['en'], t.get('fr', t['en']))
+    for dotpath, t in I18N_KEYS.items()
+)
+
+
+def set_nested(data, keys, value):
+    """Set a nested key in a dict from a tuple of path segments."""
     current = data
     for key in keys[:-1]:
         if key not in current:
@@ -160,9 +169,8 @@ def set_nested(data, dotpath, value):
     return True
 
 
-def get_nested(data, dotpath):
-    """Check if a nested key exists."""
-    keys = dotpath.split('.')
+def get_nested(data, keys):
+    """Check if a nested key exists, given a tuple of path segments."""
     current = data
     for key in keys:
         if not isinstance(current, dict) or key not in current:
@@ -171,62 +179,68 @@ def get_nested(data, dotpath):
     return current
 
 
-def process_locale(filepath, locale):
-    """Add missing keys to a locale file."""
-    with open(filepath, 'r', encoding='utf-8') as f:
-        data = json.load(f)
+def process_locale(data, locale):
+    """Add missing keys to a parsed locale tree.
 
+    Returns (added, existed, failed); failed keys have a path segment that
+    is not a dict.
+    """
     added = 0
-    skipped = 0
+    existed = 0
+    failed = 0
 
-    for dotpath, translations in NEW_KEYS.items():
-        # Determine value: use locale-specific if available, else English
-        if locale == 'fr':
-            value = translations.get('fr', translations['en'])
-        else:
-            value = translations['en']
+    # Use the French value for fr, English for every other locale
+    is_fr = locale == 'fr'
+
+    for dotpath, keys, en, fr in I18N_KEYS_RECORDS:
+        value = fr if is_fr else en
 
-        if get_nested(data, dotpath) is not None:
-            skipped += 1
+        if get_nested(data, keys) is not None:
+            existed += 1
             continue
 
-        if set_nested(data, dotpath, value):
+        if set_nested(data, keys, value):
             added += 1
         else:
+            failed += 1
             print(f"  WARNING: Could not set {dotpath} in {locale} (parent is not a dict)")
 
-    if added > 0:
-        with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(data, f, ensure_ascii=False, indent=2)
-            f.write('\n')
+    return added, existed, failed
 
-    return added, skipped
+
+def apply_keys(data, locale):
+    """add_all_keys applier: process_locale() reduced to the number of keys added."""
+    return process_locale(data, locale)[0]
 
 
 def main():
     locales_path = os.path.abspath(LOCALES_DIR)
-    print(f"Adding {len(NEW_KEYS)} keys to locale files in {locales_path}")
+    print(f"Adding {len(I18N_KEYS)} keys to locale files in {locales_path}")
     print()
 
-    total_added = 0
-    total_skipped = 0
+    counts = {}
 
-    for filename in sorted(os.listdir(locales_path)):
-        if not filename.endswith('.json'):
-            continue
-        locale = filename.replace('.json', '')
-        filepath = os.path.join(locales_path, filename)
+    def apply(data, locale):
+        counts[locale] = process_locale(data, locale)
+        return counts[locale][0]
+
+    total_added = 0
+    total_existed = 0
+    total_failed = 0
 
-        added, skipped = process_locale(filepath, locale)
+    for locale, _ in apply_key_sets([apply], locales_path):
+        added, existed, failed = counts[locale]
         total_added += added
-        total_skipped += skipped
+        total_existed += existed
+        total_failed += failed
 
         status = f"+{added}" if added > 0 else "no change"
-        print(f"  {locale:8s}: {status} ({skipped} already existed)")
+        detail = f"{existed} already existed" + (f", {failed} failed" if failed else "")
+        print(f"  {locale:8s}: {status} ({detail})")
 
     print()
-    print(f"TOTAL: {total_added} keys added, {total_skipped} already existed")
-    print(f"Keys per locale: {len(NEW_KEYS)}")
+    print(f"TOTAL: {total_added} keys added, {total_existed} already existed, {total_failed} failed")
+    print(f"Keys per locale: {len(I18N_KEYS)}")
 
 
 if __name__ == '__main__':
@@ -2,9 +2,8 @@
 """
 Add final missing keys to all locale files
 """
-import json
-import os
-import glob
+from _locales_cache import intern_strings
+from add_all_keys import apply_key_sets
 
 # Missing translations by section
 MISSING_KEYS = {
@@ -102,33 +101,43 @@ def get_translation(key_data, locale):
     """Get translation for a locale, fallback to English"""
     return key_data.get(locale, key_data.get("en", ""))
 
-def update_locale(locale_path, locale_code):
-    """Add missing keys to a locale file"""
-    with open(locale_path, 'r', encoding='utf-8') as f:
-        data = json.load(f)
+intern_strings(MISSING_KEYS)
 
+# Flat [(section, key, value)] insertion list per base locale, built once
+PER_LOCALE_PATCH = {
+    locale: [
+        (section, key, get_translation(translations, locale))
+        for section, keys in MISSING_KEYS.items()
+        for key, translations in keys.items()
+    ]
+    for locale in sorted({code for keys in MISSING_KEYS.values() for t in keys.values() for code in t})
+}
+
+def update_locale(data, locale_code):
+    """Add missing keys to a parsed locale tree, returning how many were added"""
     # Map locale to base language code
     base_locale = locale_code.split('-')[0]  # ar-dz -> ar
+    patch = PER_LOCALE_PATCH.get(base_locale) or PER_LOCALE_PATCH['en']
 
     # Add missing keys
-    for section, keys in MISSING_KEYS.items():
-        if section not in data:
-            data[section] = {}
-        for key, translations in keys.items():
-            if key not in data[section]:
-                data[section][key] = get_translation(translations, base_locale)
-
-    with open(locale_path, 'w', encoding='utf-8') as f:
-        json.dump(data, f, ensure_ascii=False, indent=2)
-
-    print(f"Updated: {locale_code}")
+    added = 0
+    for section, key, value in patch:
+        target = data.get(section)
+        if target is None:
+            target = data[section] = {}
+        if key not in target:
+            target[key] = value
+            added += 1
+    return added
 
 def main():
     locale_dir = "/Volumes/AI_Project/peptide-plus/src/i18n/locales"
 
-    for locale_file in glob.glob(f"{locale_dir}/*.json"):
-        locale_code = os.path.basename(locale_file).replace('.json', '')
-        update_locale(locale_file, locale_code)
+    for locale_code, (added,) in apply_key_sets([update_locale], locale_dir):
+        if added == 0:
+            print(f"Unchanged: {locale_code}")
+        else:
+            print(f"Updated: {locale_code} (+{added} keys)")
 
     print("\nAll missing keys added!")
 
@@ -2,9 +2,8 @@
 """Add TTS i18n keys to all 22 locale files."""
 
 import json
-import os
 
-LOCALES_DIR = os.path.join(os.path.dirname(__file__), '..', 'src', 'i18n', 'locales')
+from _locales_cache import encode_member, intern_strings, load_all, locale_of, save_all
 
 TTS_KEYS = {
     'en': {
@@ -161,32 +160,69 @@ TTS_KEYS = {
     },
 }
 
+intern_strings(TTS_KEYS)
+
 # Arabic dialects share the same translations as standard Arabic
 for dialect in ['ar-dz', 'ar-lb', 'ar-ma']:
     TTS_KEYS[dialect] = TTS_KEYS['ar'].copy()
 
-count = 0
-for filename in os.listdir(LOCALES_DIR):
-    if not filename.endswith('.json'):
-        continue
-    locale = filename.replace('.json', '')
-    filepath = os.path.join(LOCALES_DIR, filename)
-
-    with open(filepath, 'r', encoding='utf-8') as f:
-        data = json.load(f)
-
-    keys = TTS_KEYS.get(locale, TTS_KEYS['en'])
-    added = 0
-    for key, value in keys.items():
-        if key not in data:
-            data[key] = value
-            added += 1
-
-    if added > 0:
-        with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(data, f, ensure_ascii=False, indent=2)
-            f.write('\n')
-        count += added
-        print(f"  {locale}: +{added} keys")
-
-print(f"\nTotal: {count} keys added")
+# TTS keys are top-level strings, so each one is encoded once here and
+# spliced into the file instead of re-serializing the whole document.
+TTS_KEYS_ENCODED = {
+    locale: {key: encode_member(key, value) for key, value in keys.items()}
+    for locale, keys in TTS_KEYS.items()
+}
+
+# Byte patterns of each key as a top-level member of an indent=2 file
+TTS_KEYS_PATTERNS = {
+    locale: [b'\n  ' + json.dumps(key, ensure_ascii=False).encode('utf-8') + b':' for key in keys]
+    for locale, keys in TTS_KEYS.items()
+}
+
+
+def has_all_keys(locale, raw):
+    """Decide from the raw bytes, without parsing, that a locale already has every TTS key."""
+    patterns = TTS_KEYS_PATTERNS.get(locale, TTS_KEYS_PATTERNS['en'])
+    return all(raw.find(p) != -1 for p in patterns)
+
+
+def apply_keys(data, locale, appended=None):
+    """Add the TTS keys to a parsed locale tree, returning how many were added.
+
+    When `appended` is a list, the pre-encoded member of every added key is
+    collected into it.
+    """
+    # TTS keys are literal top-level names containing a dot ("tts.listen"),
+    # never nested paths, so one membership test and one dict.update suffice
+    missing = {key: value for key, value in TTS_KEYS.get(locale, TTS_KEYS['en']).items() if key not in data}
+    if not missing:
+        return 0
+    data.update(missing)
+
+    if appended is not None:
+        encoded = TTS_KEYS_ENCODED.get(locale, TTS_KEYS_ENCODED['en'])
+        appended.extend(encoded[key] for key in missing)
+    return len(missing)
+
+
+def main():
+    count = 0
+    dirty = []
+    members = {}
+    for filepath, data in load_all(skip=has_all_keys).items():
+        locale = locale_of(filepath)
+        appended = []
+        added = apply_keys(data, locale, appended)
+        if added:
+            dirty.append(filepath)
+            members[filepath] = appended
+            count += added
+            print(f"  {locale}: +{added} keys")
+
+    save_all(dirty, members=members)
+
+    print(f"\nTotal: {count} keys added")
+
+
+if __name__ == '__main__':
+    main()
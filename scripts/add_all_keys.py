@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""
+Apply the key sets of every add-*-keys script to all locale files in one pass.
+
+Running the four scripts one after the other parses and rewrites each of the
+22 locale files four times; here each file is loaded once, patched by every
+key set in turn, and written at most once. The individual scripts remain as
+entry points that call apply_key_sets() with only their own key set.
+"""
+import importlib.util
+import os
+
+from _locales_cache import LOCALES_DIR, load_all, locale_of, save_all
+
+SCRIPTS_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# (script, applier) in the order the scripts were historically run.
+# Every applier has the signature fn(data, locale) -> number of keys added.
+KEY_SCRIPTS = [
+    ('add-i18n-keys', 'apply_keys'),
+    ('add-checkout-keys', 'apply_keys'),
+    ('add-missing-keys', 'update_locale'),
+    ('add-tts-keys', 'apply_keys'),
+]
+
+
+def apply_key_sets(appliers, locales_dir=LOCALES_DIR):
+    """Run every applier over each locale, writing changed files once.
+
+    Returns [(locale, [added per applier]), ...] in locale order.
+    """
+    results = []
+    dirty = []
+
+    for filepath, data in load_all(locales_dir).items():
+        locale = locale_of(filepath)
+        added = [apply(data, locale) for apply in appliers]
+        if any(added):
+            dirty.append(filepath)
+        results.append((locale, added))
+
+    save_all(dirty, locales_dir)
+    return results
+
+
+def load_script(name):
+    """Import a hyphenated sibling script (e.g. 'add-tts-keys') as a module."""
+    path = os.path.join(SCRIPTS_DIR, name + '.py')
+    spec = importlib.util.spec_from_file_location(name.replace('-', '_'), path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def main():
+    appliers = [getattr(load_script(script), fn) for script, fn in KEY_SCRIPTS]
+    results = apply_key_sets(appliers)
+
+    totals = [0] * len(KEY_SCRIPTS)
+    for locale, added in results:
+        for i, n in enumerate(added):
+            totals[i] += n
+        if any(added):
+            detail = ', '.join(f"{script} +{n}" for (script, _), n in zip(KEY_SCRIPTS, added) if n)
+            print(f"  {locale:8s}: {detail}")
+        else:
+            print(f"  {locale:8s}: no change")
+
+    print()
+    for (script, _), total in zip(KEY_SCRIPTS, totals):
+        print(f"  {script}: {total} keys added")
+    print(f"TOTAL: {sum(totals)} keys added across {len(results)} locales")
+
+
+if __name__ == '__main__':
+    main()
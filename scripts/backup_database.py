@@ -20,20 +20,35 @@ Usage:
     python3 backup_database.py --restore-latest   # Restore from latest backup
     python3 backup_database.py --cleanup          # Remove old backups per retention policy
     python3 backup_database.py --verify <file>    # Verify backup integrity
+    python3 backup_database.py --verify-all       # Re-hash all backups against the manifest
 """
 
 import argparse
-import gzip
+import base64
+import functools
 import hashlib
 import json
 import logging
+import mmap
 import os
+import re
 import shutil
+import struct
 import subprocess
 import sys
+import tempfile
+import threading
+import time
+import zlib
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Tuple
+
+try:
+    import zstandard
+except ImportError:  # gzip backups only
+    zstandard = None
 
 logging.basicConfig(level=logging.INFO, format="%(asctime)s [%(levelname)s] %(message)s")
 log = logging.getLogger(__name__)
@@ -53,6 +68,9 @@ if not _LOCAL_ROOT.exists():
 else:
     BACKUP_DIR = PROJECT_ROOT / "backups"
 MANIFEST_FILE = BACKUP_DIR / "backup_manifest.json"
+# One JSON line per backup, appended (older entries may still live in
+# MANIFEST_FILE["backups"]); MANIFEST_FILE keeps only the last_* timestamps
+MANIFEST_LOG = BACKUP_DIR / "backup_manifest.jsonl"
 
 # Local DB (brew postgresql@14 on port 5432, or Docker on port 5433)
 LOCAL_DB = {
@@ -71,6 +89,20 @@ AZURE_CONTAINER = "peptide-backups"
 AZURE_STORAGE_ACCOUNT = "lovepicsstorage"
 AZURE_KEYCHAIN_SERVICE = "azure-blob-connection"
 AZURE_KEYCHAIN_ACCOUNT = "aurelia-backup"
+AZURE_MAX_CONCURRENCY = int(os.environ.get("PEPTIDE_AZURE_CONCURRENCY", "8"))
+AZURE_BLOCK_SIZE = 8 * 1024 * 1024
+
+# Backups are plain SQL, compressed in a single pass. With the zstandard
+# package they are zstd level 3 (.sql.zst, multi-threaded, in-process);
+# otherwise gzip at PG_DUMP_COMPRESS_LEVEL, piped through pigz on all cores
+# when installed or done by pg_dump itself (-Z). Plain format keeps backups
+# restorable with psql (see restore_from_backup). Both kinds are read back.
+PG_DUMP_COMPRESS_LEVEL = 6
+ZSTD_LEVEL = 3
+BACKUP_SUFFIX = ".sql.zst" if zstandard else ".sql.gz"
+BACKUP_SUFFIXES = (".sql.gz", ".sql.zst")
+# Chunk size for streaming the compressed dump to disk (copyfileobj defaults to 64 KiB)
+COPY_BUFFER_SIZE = 1024 * 1024
 
 # Retention policy (commercial data = longer retention)
 RETENTION = {
@@ -86,13 +118,52 @@ BACKUP_DIR.mkdir(parents=True, exist_ok=True)
 # HELPERS
 # =============================================================================
 
+def _fadvise(fd: int, advice: str) -> None:
+    """posix_fadvise() over a whole file; a no-op where unsupported (macOS)."""
+    try:
+        os.posix_fadvise(fd, 0, 0, getattr(os, advice))
+    except (AttributeError, OSError):
+        pass
+
+
+def _drop_page_cache(filepath) -> None:
+    """Ask the kernel to evict a finished archive from the page cache.
+
+    Archives are written once and then only uploaded, so keeping them cached
+    just pushes out pages of the database and app running on this host.
+    """
+    try:
+        fd = os.open(str(filepath), os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        _fadvise(fd, "POSIX_FADV_DONTNEED")
+    finally:
+        os.close(fd)
+
+
 def _sha256(filepath: str) -> str:
-    """Calculate SHA256 hash of a file."""
-    h = hashlib.sha256()
+    """Calculate SHA256 hash of a file.
+
+    Hashing runs in C with large buffers (hashlib.file_digest on 3.11+, one
+    call over an mmap before that) so OpenSSL can use SHA-NI / ARMv8 SHA2.
+    """
     with open(filepath, "rb") as f:
-        for chunk in iter(lambda: f.read(8192), b""):
-            h.update(chunk)
-    return h.hexdigest()
+        _fadvise(f.fileno(), "POSIX_FADV_SEQUENTIAL")
+        if hasattr(hashlib, "file_digest"):
+            return hashlib.file_digest(f, "sha256").hexdigest()
+        if os.fstat(f.fileno()).st_size == 0:
+            return hashlib.sha256().hexdigest()
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            return hashlib.sha256(mm).hexdigest()
+
+
+def _sha256_many(paths: List[str]) -> Dict[str, str]:
+    """SHA256 of several files at once, one process per core (hashing is CPU-bound)."""
+    if len(paths) <= 1:
+        return {p: _sha256(p) for p in paths}
+    with ProcessPoolExecutor(max_workers=min(len(paths), os.cpu_count() or 1)) as ex:
+        return dict(zip(paths, ex.map(_sha256, paths)))
 
 
 def _notify_macos(title: str, message: str):
@@ -123,6 +194,11 @@ def _get_azure_connection_string() -> Optional[str]:
     return None
 
 
+# Local and production backups may run concurrently (--all) and both
+# update the manifest
+_MANIFEST_LOCK = threading.Lock()
+
+
 def _load_manifest() -> Dict:
     """Load backup manifest."""
     if MANIFEST_FILE.exists():
@@ -134,26 +210,226 @@ def _load_manifest() -> Dict:
 
 
 def _save_manifest(manifest: Dict):
-    """Save backup manifest."""
-    MANIFEST_FILE.write_text(json.dumps(manifest, indent=2, default=str))
+    """Save backup manifest (temp file + rename, so a crash never truncates it)."""
+    tmp = MANIFEST_FILE.with_suffix(".tmp")
+    tmp.write_text(json.dumps(manifest, indent=2, default=str))
+    os.replace(tmp, MANIFEST_FILE)
+
+
+def _touch_manifest(key: str):
+    """Set a last_* timestamp in the manifest."""
+    with _MANIFEST_LOCK:
+        manifest = _load_manifest()
+        manifest[key] = datetime.now().isoformat()
+        _save_manifest(manifest)
+
+
+def _append_manifest(entry: Dict):
+    """Record a backup: one appended JSON line instead of rewriting the whole manifest."""
+    line = json.dumps(entry, default=str) + "\n"
+    with _MANIFEST_LOCK:
+        with open(MANIFEST_LOG, "a") as f:
+            f.write(line)
+
+
+def _iter_manifest_entries():
+    """Yield every recorded backup, legacy MANIFEST_FILE entries first, streaming the JSONL log."""
+    yield from _load_manifest().get("backups", [])
+    if MANIFEST_LOG.exists():
+        with open(MANIFEST_LOG) as f:
+            for line in f:
+                try:
+                    yield json.loads(line)
+                except ValueError:
+                    continue  # torn last line from an interrupted append
+
+
+# The whole rest of the line: a quote may be part of the password itself
+_ENV_DATABASE_URL_RE = re.compile(rb"(?m)^[ \t]*DATABASE_URL=([^\r\n]*)")
 
 
+@functools.lru_cache(maxsize=1)
 def _get_production_db_url() -> Optional[str]:
-    """Get production DATABASE_URL from .env file."""
+    """Get production DATABASE_URL from .env file (read once per run)."""
     env_file = PROJECT_ROOT / ".env"
-    if not env_file.exists():
+    try:
+        data = env_file.read_bytes()
+    except OSError:
         return None
+    for m in _ENV_DATABASE_URL_RE.finditer(data):
+        url = m.group(1).strip()
+        if b"localhost" in url or b"5433" in url:
+            continue
+        # Only one matching pair of surrounding quotes belongs to the .env syntax
+        if len(url) >= 2 and url[:1] in (b'"', b"'") and url[-1:] == url[:1]:
+            url = url[1:-1]
+        return url.decode()
+    return None
+
+
+class HashingWriter:
+    """File-like wrapper that SHA256-hashes every byte written through it."""
+
+    def __init__(self, fp):
+        self.fp = fp
+        self.h = hashlib.sha256()
+
+    def write(self, b) -> int:
+        self.h.update(b)
+        return self.fp.write(b)
+
+
+# One reusable COPY_BUFFER_SIZE buffer per thread (--all dumps concurrently)
+_buffers = threading.local()
+
+
+def _copy_into(src, dst) -> None:
+    """copyfileobj() through this thread's preallocated buffer instead of a fresh one per call."""
+    view = getattr(_buffers, "view", None)
+    if view is None:
+        view = _buffers.view = memoryview(bytearray(COPY_BUFFER_SIZE))
+    while n := src.readinto(view):
+        dst.write(view[:n])
+
+
+def _run_pg_dump(cmd: List[str], archive: Path, timeout: int,
+                 env: Optional[Dict[str, str]] = None) -> Tuple[subprocess.CompletedProcess, str]:
+    """Run pg_dump and write its output compressed to archive.
+
+    A .zst archive is compressed in-process by zstandard on all cores. For
+    .gz, pg_dump's stdout is streamed straight into `pigz -p <cores>` when
+    available, otherwise pg_dump compresses with -Z. Either way there is no
+    intermediate .sql file, and the compressed stream is SHA256-hashed as it
+    is written so the archive never has to be re-read.
+
+    Returns (CompletedProcess whose stderr holds the text stderr of every
+    process, sha256 hex digest of archive).
+    """
+    pigz = shutil.which("pigz")
+    procs = []
     try:
-        for line in env_file.read_text().split("\n"):
-            line = line.strip()
-            if line.startswith("DATABASE_URL=") and "localhost" not in line and "5433" not in line:
-                url = line.split("=", 1)[1].strip().strip('"').strip("'")
-                return url
-    except Exception:
-        pass
+        with open(archive, "wb", buffering=COPY_BUFFER_SIZE) as out, tempfile.TemporaryFile() as err:
+            if archive.name.endswith(".zst"):
+                procs.append(subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=err, env=env))
+            elif pigz:
+                dump = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=err, env=env)
+                procs.append(dump)
+                comp = subprocess.Popen(
+                    [pigz, "-p", str(os.cpu_count() or 1), f"-{PG_DUMP_COMPRESS_LEVEL}", "-c"],
+                    stdin=dump.stdout, stdout=subprocess.PIPE, stderr=err,
+                )
+                dump.stdout.close()  # pigz owns the pipe; pg_dump gets SIGPIPE if pigz dies
+                procs.append(comp)
+            else:
+                procs.append(subprocess.Popen(cmd + ["-Z", str(PG_DUMP_COMPRESS_LEVEL)],
+                                              stdout=subprocess.PIPE, stderr=err, env=env))
+            source = procs[-1].stdout
+
+            # The pump below blocks on reads, so the deadline is enforced by killing
+            timed_out = threading.Event()
+
+            def _kill():
+                timed_out.set()
+                for p in procs:
+                    p.kill()
+
+            killer = threading.Timer(timeout, _kill)
+            killer.start()
+            try:
+                writer = HashingWriter(out)
+                if archive.name.endswith(".zst"):
+                    zstandard.ZstdCompressor(level=ZSTD_LEVEL, threads=-1).copy_stream(
+                        source, writer, read_size=COPY_BUFFER_SIZE, write_size=COPY_BUFFER_SIZE)
+                else:
+                    _copy_into(source, writer)
+                source.close()
+                for p in procs:
+                    p.wait()
+            finally:
+                killer.cancel()
+            if timed_out.is_set():
+                raise subprocess.TimeoutExpired(cmd, timeout)
+
+            err.seek(0)
+            stderr = err.read().decode("utf-8", errors="replace")
+    except BaseException:
+        # A failed start, pump error (e.g. ENOSPC) or timeout: stop every
+        # process and never leave a partial archive for get_latest_backup
+        for p in procs:
+            if p.poll() is None:
+                p.kill()
+            p.wait()
+        archive.unlink(missing_ok=True)
+        raise
+
+    returncode = next((p.returncode for p in procs if p.returncode), 0)
+    return subprocess.CompletedProcess(cmd, returncode, "", stderr), writer.h.hexdigest()
+
+
+def _feed_zstd(src: Path) -> Tuple[Any, threading.Thread, List[str]]:
+    """Decompress a .zst archive into a pipe from a background thread.
+
+    Returns (read end of the pipe, feeder thread, list that receives the
+    feeder's error message if decompression fails).
+    """
+    r, w = os.pipe()
+    errors: List[str] = []
+
+    def _feed():
+        try:
+            with open(src, "rb") as f, open(w, "wb") as out:
+                zstandard.ZstdDecompressor().copy_stream(f, out, write_size=COPY_BUFFER_SIZE)
+        except BrokenPipeError:
+            pass  # reader stopped early; it reports why
+        except Exception as e:
+            errors.append(str(e))
+
+    feeder = threading.Thread(target=_feed, daemon=True)
+    feeder.start()
+    return open(r, "rb"), feeder, errors
+
+
+def _test_archive(src: Path) -> Optional[str]:
+    """Decompress src end to end without keeping the output; error message or None.
+
+    Checks what a SHA256 cannot when none was recorded: a truncated or
+    corrupt archive (gzip CRC/length trailer, zstd frame checksums).
+    """
+    name = str(src)
+    if name.endswith(".gz"):
+        pigz = shutil.which("pigz")
+        cmd = [pigz, "-p", str(os.cpu_count() or 1), "-t", name] if pigz else ["gzip", "-t", name]
+        proc = subprocess.run(cmd, capture_output=True, text=True, timeout=600)
+        if proc.returncode:
+            return proc.stderr.strip() or f"{cmd[0]} -t failed"
+        return None
+    if name.endswith(".zst"):
+        # decompressobj rather than stream_reader: only it reports (via .eof)
+        # whether the frame was complete, a truncated file just reads short.
+        # Our archives are one frame (ZstdCompressor.copy_stream).
+        dobj = zstandard.ZstdDecompressor().decompressobj()
+        try:
+            with open(src, "rb") as f:
+                while chunk := f.read(COPY_BUFFER_SIZE):
+                    if dobj.eof:
+                        return "zstd: trailing data after the frame"
+                    dobj.decompress(chunk)
+        except zstandard.ZstdError as e:
+            return f"zstd: {e}"
+        if not dobj.eof:
+            return "zstd: unexpected end of file (truncated frame)"
+        if dobj.unused_data:
+            return "zstd: trailing data after the frame"
     return None
 
 
+def _open_decompressor(src: Path, stderr) -> subprocess.Popen:
+    """Start `pigz -dc` (or `gzip -dc` without pigz) streaming src's SQL on stdout."""
+    pigz = shutil.which("pigz")
+    cmd = [pigz, "-p", str(os.cpu_count() or 1), "-dc", str(src)] if pigz else ["gzip", "-dc", str(src)]
+    return subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=stderr)
+
+
 # =============================================================================
 # BACKUP
 # =============================================================================
@@ -161,8 +437,7 @@ def _get_production_db_url() -> Optional[str]:
 def backup_local_db() -> Dict[str, Any]:
     """Backup local Docker PostgreSQL database."""
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    dump_file = BACKUP_DIR / f"peptide_local_{timestamp}.sql"
-    gz_file = BACKUP_DIR / f"peptide_local_{timestamp}.sql.gz"
+    archive = BACKUP_DIR / f"peptide_local_{timestamp}{BACKUP_SUFFIX}"
 
     result = {
         "type": "local",
@@ -179,9 +454,9 @@ def backup_local_db() -> Dict[str, Any]:
         if "peptide" not in docker_check.stdout.lower() and "postgres" not in docker_check.stdout.lower():
             log.warning("PostgreSQL Docker container may not be running")
 
-        # Run pg_dump
+        # Run pg_dump, compressing on the fly (no intermediate .sql file)
         env = {**os.environ, "PGPASSWORD": LOCAL_DB["password"]}
-        proc = subprocess.run([
+        proc, sha = _run_pg_dump([
             "pg_dump",
             "-h", LOCAL_DB["host"],
             "-p", LOCAL_DB["port"],
@@ -189,44 +464,34 @@ def backup_local_db() -> Dict[str, Any]:
             "-d", LOCAL_DB["name"],
             "--no-owner",
             "--no-acl",
-            "-f", str(dump_file),
-        ], capture_output=True, text=True, timeout=300, env=env)
+        ], archive, timeout=300, env=env)
 
         if proc.returncode != 0:
+            # Never leave a truncated archive behind for get_latest_backup to pick up
+            archive.unlink(missing_ok=True)
             result["status"] = "error"
             result["error"] = proc.stderr[:500]
             _notify_macos("Peptide-Plus Backup FAILED", proc.stderr[:100])
             return result
 
-        # Compress with gzip
-        with open(dump_file, "rb") as f_in:
-            with gzip.open(str(gz_file), "wb") as f_out:
-                shutil.copyfileobj(f_in, f_out)
+        size = archive.stat().st_size
 
-        # Remove uncompressed
-        dump_file.unlink()
-
-        # Calculate SHA256
-        sha = _sha256(str(gz_file))
-        size = gz_file.stat().st_size
-
-        result["file"] = str(gz_file)
-        result["filename"] = gz_file.name
+        result["file"] = str(archive)
+        result["filename"] = archive.name
         result["size_bytes"] = size
         result["size_mb"] = round(size / 1024 / 1024, 2)
         result["sha256"] = sha
         result["status"] = "success"
 
         # Update manifest
-        manifest = _load_manifest()
-        manifest["backups"].append(result)
-        manifest["last_local"] = datetime.now().isoformat()
-        _save_manifest(manifest)
+        _append_manifest(result)
+        _touch_manifest("last_local")
 
-        log.info(f"Local backup: {gz_file.name} ({result['size_mb']} MB, SHA256: {sha[:16]}...)")
+        log.info(f"Local backup: {archive.name} ({result['size_mb']} MB, SHA256: {sha[:16]}...)")
         return result
 
     except subprocess.TimeoutExpired:
+        archive.unlink(missing_ok=True)
         result["status"] = "error"
         result["error"] = "pg_dump timed out (>5 min)"
         _notify_macos("Peptide-Plus Backup TIMEOUT", "pg_dump took too long")
@@ -245,8 +510,7 @@ def backup_local_db() -> Dict[str, Any]:
 def backup_production_db() -> Dict[str, Any]:
     """Backup production Azure PostgreSQL database."""
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    dump_file = BACKUP_DIR / f"peptide_production_{timestamp}.sql"
-    gz_file = BACKUP_DIR / f"peptide_production_{timestamp}.sql.gz"
+    archive = BACKUP_DIR / f"peptide_production_{timestamp}{BACKUP_SUFFIX}"
 
     result = {
         "type": "production",
@@ -262,13 +526,13 @@ def backup_production_db() -> Dict[str, Any]:
     result["source"] = "azure_production"
 
     try:
-        proc = subprocess.run([
+        proc, sha = _run_pg_dump([
             "pg_dump", db_url,
             "--no-owner", "--no-acl",
-            "-f", str(dump_file),
-        ], capture_output=True, text=True, timeout=600)
+        ], archive, timeout=600)
 
         if proc.returncode != 0:
+            archive.unlink(missing_ok=True)
             result["status"] = "error"
             # Mask connection string in error
             error = proc.stderr[:500]
@@ -278,31 +542,23 @@ def backup_production_db() -> Dict[str, Any]:
             _notify_macos("Peptide-Plus PROD Backup FAILED", error[:100])
             return result
 
-        # Compress
-        with open(dump_file, "rb") as f_in:
-            with gzip.open(str(gz_file), "wb") as f_out:
-                shutil.copyfileobj(f_in, f_out)
-        dump_file.unlink()
+        size = archive.stat().st_size
 
-        sha = _sha256(str(gz_file))
-        size = gz_file.stat().st_size
-
-        result["file"] = str(gz_file)
-        result["filename"] = gz_file.name
+        result["file"] = str(archive)
+        result["filename"] = archive.name
         result["size_bytes"] = size
         result["size_mb"] = round(size / 1024 / 1024, 2)
         result["sha256"] = sha
         result["status"] = "success"
 
-        manifest = _load_manifest()
-        manifest["backups"].append(result)
-        manifest["last_production"] = datetime.now().isoformat()
-        _save_manifest(manifest)
+        _append_manifest(result)
+        _touch_manifest("last_production")
 
-        log.info(f"Production backup: {gz_file.name} ({result['size_mb']} MB)")
+        log.info(f"Production backup: {archive.name} ({result['size_mb']} MB)")
         return result
 
     except subprocess.TimeoutExpired:
+        archive.unlink(missing_ok=True)
         result["status"] = "error"
         result["error"] = "Production pg_dump timed out (>10 min)"
         return result
@@ -312,8 +568,86 @@ def backup_production_db() -> Dict[str, Any]:
         return result
 
 
+def _upload_with_sdk(conn_str: str, filepath: str, blob_name: str, size: int,
+                     metadata: Dict[str, str]):
+    """Upload through azure-storage-blob, no CLI process.
+
+    Files larger than one block are staged as AZURE_BLOCK_SIZE blocks in
+    parallel, read as slices of a read-only mmap (never the whole file in
+    memory), then committed in order with the Cool tier.
+    """
+    from azure.core.exceptions import ResourceExistsError
+    from azure.storage.blob import BlobBlock, BlobServiceClient, StandardBlobTier
+
+    service = BlobServiceClient.from_connection_string(conn_str)
+    try:
+        service.create_container(AZURE_CONTAINER)
+    except ResourceExistsError:
+        pass
+
+    blob = service.get_blob_client(AZURE_CONTAINER, blob_name)
+    if size <= AZURE_BLOCK_SIZE:
+        with open(filepath, "rb") as f:
+            blob.upload_blob(f, length=size, overwrite=True, metadata=metadata,
+                             standard_blob_tier=StandardBlobTier.COOL)
+        return
+
+    offsets = range(0, size, AZURE_BLOCK_SIZE)
+    # Block ids must all have the same length within a blob
+    block_ids = [base64.b64encode(f"{i:08d}".encode()).decode() for i in range(len(offsets))]
+    with open(filepath, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        def _stage(block_id: str, offset: int):
+            blob.stage_block(block_id, mm[offset:offset + AZURE_BLOCK_SIZE])
+
+        with ThreadPoolExecutor(max_workers=AZURE_MAX_CONCURRENCY) as ex:
+            # list() re-raises the first failed block
+            list(ex.map(_stage, block_ids, offsets))
+
+    blob.commit_block_list([BlobBlock(block_id=b) for b in block_ids], metadata=metadata,
+                           standard_blob_tier=StandardBlobTier.COOL)
+
+
+def _upload_with_az_cli(conn_str: str, filepath: str, blob_name: str, size: int,
+                        metadata: Dict[str, str]):
+    """Upload through the az CLI (fallback when azure-storage-blob is not installed)."""
+    az_env = {**os.environ, "AZURE_STORAGE_CONNECTION_STRING": conn_str}
+
+    # Ensure container exists
+    subprocess.run([
+        "az", "storage", "container", "create",
+        "--name", AZURE_CONTAINER,
+        "--public-access", "off",
+    ], capture_output=True, text=True, timeout=30, env=az_env)
+
+    proc = subprocess.run([
+        "az", "storage", "blob", "upload",
+        "--container-name", AZURE_CONTAINER,
+        "--file", filepath,
+        "--name", blob_name,
+        "--overwrite", "true",
+        "--tier", "Cool",
+        *(["--metadata", *(f"{k}={v}" for k, v in metadata.items())] if metadata else []),
+    ], capture_output=True, text=True, timeout=1800, env=az_env)
+
+    if proc.returncode != 0:
+        raise RuntimeError(proc.stderr)
+
+
+def _recorded_sha256(filename: str) -> Optional[str]:
+    """SHA256 recorded in the manifest when the backup was written (latest record wins)."""
+    sha = None
+    for entry in _iter_manifest_entries():
+        if entry.get("filename") == filename and entry.get("sha256"):
+            sha = entry["sha256"]
+    return sha
+
+
 def upload_to_azure(filepath: str) -> Dict[str, Any]:
-    """Upload a backup file to Azure Blob Storage."""
+    """Upload a backup file to Azure Blob Storage.
+
+    The SHA256 computed while the backup was written is attached as blob
+    metadata, so the file is not read again just to hash it.
+    """
     conn_str = _get_azure_connection_string()
     if not conn_str:
         return {
@@ -325,42 +659,32 @@ def upload_to_azure(filepath: str) -> Dict[str, Any]:
     size = Path(filepath).stat().st_size
 
     try:
-        az_env = {**os.environ, "AZURE_STORAGE_CONNECTION_STRING": conn_str}
+        try:
+            import azure.storage.blob  # noqa: F401
+            upload = _upload_with_sdk
+        except ImportError:
+            upload = _upload_with_az_cli
 
-        # Ensure container exists
-        subprocess.run([
-            "az", "storage", "container", "create",
-            "--name", AZURE_CONTAINER,
-            "--public-access", "off",
-        ], capture_output=True, text=True, timeout=30, env=az_env)
+        sha = _recorded_sha256(blob_name)
+        metadata = {"sha256": sha} if sha else {}
 
-        # Upload
         log.info(f"Uploading {size / 1024 / 1024:.1f} MB to Azure: {blob_name}")
-        proc = subprocess.run([
-            "az", "storage", "blob", "upload",
-            "--container-name", AZURE_CONTAINER,
-            "--file", filepath,
-            "--name", blob_name,
-            "--overwrite", "true",
-            "--tier", "Cool",
-        ], capture_output=True, text=True, timeout=1800, env=az_env)
+        upload(conn_str, filepath, blob_name, size, metadata)
+        _drop_page_cache(filepath)
 
-        if proc.returncode == 0:
-            log.info(f"Uploaded to Azure: {blob_name}")
-            return {
-                "status": "uploaded",
-                "blob": blob_name,
-                "container": AZURE_CONTAINER,
-                "size_mb": round(size / 1024 / 1024, 2),
-            }
-        else:
-            stderr = proc.stderr.replace(conn_str, "***") if conn_str else proc.stderr
-            return {"status": "error", "error": stderr[:500]}
+        log.info(f"Uploaded to Azure: {blob_name}")
+        return {
+            "status": "uploaded",
+            "blob": blob_name,
+            "container": AZURE_CONTAINER,
+            "size_mb": round(size / 1024 / 1024, 2),
+            "sha256": sha,
+        }
 
     except FileNotFoundError:
-        return {"status": "error", "error": "az CLI not found. Install: brew install azure-cli"}
+        return {"status": "error", "error": "az CLI not found. Install: pip install azure-storage-blob (or brew install azure-cli)"}
     except Exception as e:
-        return {"status": "error", "error": str(e)}
+        return {"status": "error", "error": str(e).replace(conn_str, "***")[:500]}
 
 
 # =============================================================================
@@ -371,7 +695,7 @@ def restore_from_backup(filepath: str, target: str = "local") -> Dict[str, Any]:
     """Restore a database from a backup file.
 
     Args:
-        filepath: Path to .sql.gz backup file
+        filepath: Path to .sql.gz / .sql.zst backup file
         target: 'local' (Docker port 5433) or 'production' (Azure)
     """
     path = Path(filepath)
@@ -384,43 +708,70 @@ def restore_from_backup(filepath: str, target: str = "local") -> Dict[str, Any]:
         "timestamp": datetime.now().isoformat(),
     }
 
+    if str(path).endswith(".zst") and zstandard is None:
+        return {"status": "error", "error": "zstandard not installed. Install: pip install zstandard"}
+
     try:
-        # Verify integrity first
+        # Verify integrity first: the SQL is streamed into psql, so a corrupt
+        # archive must be rejected before psql sees a single statement
         sha = _sha256(filepath)
         result["sha256"] = sha
-
-        # Decompress to temp file
-        sql_file = path.with_suffix("")  # Remove .gz
-        if str(path).endswith(".gz"):
-            with gzip.open(str(path), "rb") as f_in:
-                with open(str(sql_file), "wb") as f_out:
-                    shutil.copyfileobj(f_in, f_out)
+        recorded = _recorded_sha256(path.name)
+        if recorded:
+            if sha != recorded:
+                result["status"] = "error"
+                result["error"] = f"SHA256 mismatch: manifest has {recorded[:16]}..., file is {sha[:16]}..."
+                return result
         else:
-            sql_file = path
+            problem = _test_archive(path)
+            if problem:
+                result["status"] = "error"
+                result["error"] = f"Archive is corrupt: {problem}"[:500]
+                return result
 
         if target == "local":
             env = {**os.environ, "PGPASSWORD": LOCAL_DB["password"]}
-            proc = subprocess.run([
+            cmd = [
                 "psql",
                 "-h", LOCAL_DB["host"],
                 "-p", LOCAL_DB["port"],
                 "-U", LOCAL_DB["user"],
                 "-d", LOCAL_DB["name"],
-                "-f", str(sql_file),
-            ], capture_output=True, text=True, timeout=600, env=env)
+            ]
         elif target == "production":
             db_url = _get_production_db_url()
             if not db_url:
                 return {"status": "error", "error": "Production DATABASE_URL not found"}
-            proc = subprocess.run([
-                "psql", db_url, "-f", str(sql_file),
-            ], capture_output=True, text=True, timeout=600)
+            env = None
+            cmd = ["psql", db_url]
         else:
             return {"status": "error", "error": f"Unknown target: {target}"}
 
-        # Cleanup temp sql file
-        if str(path).endswith(".gz") and sql_file.exists():
-            sql_file.unlink()
+        if str(path).endswith(".gz"):
+            # Stream the SQL straight into psql: no decompressed copy on disk
+            with tempfile.TemporaryFile() as err:
+                decomp = _open_decompressor(path, err)
+                try:
+                    proc = subprocess.run(cmd, stdin=decomp.stdout, capture_output=True,
+                                          text=True, timeout=600, env=env)
+                finally:
+                    decomp.stdout.close()  # decompressor gets SIGPIPE if psql stopped early
+                    decomp.wait()
+                err.seek(0)
+                decomp_err = err.read().decode("utf-8", errors="replace")
+            if decomp.returncode != 0 and proc.returncode == 0:
+                proc = subprocess.CompletedProcess(cmd, decomp.returncode, "", decomp_err.strip())
+        elif str(path).endswith(".zst"):
+            source, feeder, errors = _feed_zstd(path)
+            with source:
+                proc = subprocess.run(cmd, stdin=source, capture_output=True,
+                                      text=True, timeout=600, env=env)
+            feeder.join()
+            if errors and proc.returncode == 0:
+                proc = subprocess.CompletedProcess(cmd, 1, "", errors[0])
+        else:
+            proc = subprocess.run(cmd + ["-f", str(path)], capture_output=True,
+                                  text=True, timeout=600, env=env)
 
         if proc.returncode == 0:
             result["status"] = "restored"
@@ -437,17 +788,35 @@ def restore_from_backup(filepath: str, target: str = "local") -> Dict[str, Any]:
         return result
 
 
+def _scan_backups(prefix: str = "peptide_") -> List[os.DirEntry]:
+    """Backup archives in BACKUP_DIR whose name starts with prefix, oldest first.
+
+    DirEntry caches its stat() result, so callers can read st_mtime/st_size
+    as often as they like without further syscalls.
+    """
+    with os.scandir(BACKUP_DIR) as it:
+        entries = [e for e in it if e.name.startswith(prefix) and e.name.endswith(BACKUP_SUFFIXES)]
+    entries.sort(key=lambda e: e.stat().st_mtime)
+    return entries
+
+
 def get_latest_backup(backup_type: str = "local") -> Optional[str]:
     """Get path to the latest backup file of given type."""
-    pattern = f"peptide_{backup_type}_*.sql.gz"
-    backups = sorted(BACKUP_DIR.glob(pattern), key=lambda f: f.stat().st_mtime)
-    return str(backups[-1]) if backups else None
+    backups = _scan_backups(f"peptide_{backup_type}_")
+    return backups[-1].path if backups else None
 
 
 # =============================================================================
 # VERIFY
 # =============================================================================
 
+def _looks_like_sql(preview: str) -> bool:
+    return any(kw in preview for kw in [
+        "PostgreSQL", "CREATE TABLE", "INSERT INTO",
+        "pg_dump", "SET statement_timeout",
+    ])
+
+
 def verify_backup(filepath: str) -> Dict[str, Any]:
     """Verify backup integrity."""
     path = Path(filepath)
@@ -474,22 +843,40 @@ def verify_backup(filepath: str) -> Dict[str, Any]:
         sha = _sha256(filepath)
         result["sha256"] = sha
 
-        # Try to decompress and check SQL content
+        # Check archive framing and SQL content without decompressing the whole file
         if str(filepath).endswith(".gz"):
-            with gzip.open(filepath, "rt", errors="replace") as f:
-                first_lines = []
-                for i, line in enumerate(f):
-                    first_lines.append(line)
-                    if i >= 10:
-                        break
-
-            content_preview = "".join(first_lines)
-            has_sql = any(kw in content_preview for kw in [
-                "PostgreSQL", "CREATE TABLE", "INSERT INTO",
-                "pg_dump", "SET statement_timeout",
-            ])
-            result["valid_sql"] = has_sql
+            with open(filepath, "rb") as f:
+                head = f.read(65536)
+                f.seek(-8, os.SEEK_END)
+                crc, isize = struct.unpack("<II", f.read(8))
+
+            if head[:2] != b"\x1f\x8b":
+                result["status"] = "error"
+                result["error"] = "Not a gzip file (bad magic bytes)"
+                return result
+            # Trailer of the (last) gzip member: CRC32 and size mod 2^32 of the SQL
+            result["crc32"] = f"{crc:08x}"
+            result["isize"] = isize
+
+            # 16 + MAX_WBITS: expect a gzip header; only the first 4 KiB is needed
+            raw = zlib.decompressobj(16 + zlib.MAX_WBITS).decompress(head, 4096)
+            content_preview = raw.decode("utf-8", errors="replace")
+            result["valid_sql"] = _looks_like_sql(content_preview)
             result["preview"] = content_preview[:200]
+        elif str(filepath).endswith(".zst"):
+            with open(filepath, "rb") as f:
+                if f.read(4) != b"\x28\xb5\x2f\xfd":
+                    result["status"] = "error"
+                    result["error"] = "Not a zstd file (bad magic bytes)"
+                    return result
+                if zstandard is None:
+                    result["valid_sql"] = True  # Framing only without zstandard
+                else:
+                    f.seek(0)
+                    with zstandard.ZstdDecompressor().stream_reader(f) as reader:
+                        content_preview = reader.read(4096).decode("utf-8", errors="replace")
+                    result["valid_sql"] = _looks_like_sql(content_preview)
+                    result["preview"] = content_preview[:200]
         else:
             result["valid_sql"] = True  # Assume valid for non-gz
 
@@ -502,41 +889,58 @@ def verify_backup(filepath: str) -> Dict[str, Any]:
         return result
 
 
+def verify_all_backups() -> List[Dict]:
+    """Re-hash every backup in parallel and compare with the SHA256 recorded at backup time."""
+    recorded = {e["filename"]: e.get("sha256") for e in _iter_manifest_entries() if e.get("filename")}
+    backups = _scan_backups()
+    hashes = _sha256_many([b.path for b in backups])
+
+    results = []
+    for b in backups:
+        sha = hashes[b.path]
+        expected = recorded.get(b.name)
+        if not expected:
+            status = "unrecorded"
+        elif expected == sha:
+            status = "ok"
+        else:
+            status = "mismatch"
+        results.append({"name": b.name, "sha256": sha, "expected": expected, "status": status})
+    return results
+
+
 # =============================================================================
 # CLEANUP (Retention Policy)
 # =============================================================================
 
 def cleanup_old_backups() -> Dict[str, Any]:
     """Remove old backups according to retention policy."""
-    now = datetime.now()
+    # Absolute cutoffs: "age in whole days <= N" means mtime within the last N+1 days
+    now_ts = time.time()
+    daily_cut = now_ts - (RETENTION["daily"] + 1) * 86400
+    weekly_cut = now_ts - (RETENTION["weekly"] * 7 + 1) * 86400
+    monthly_cut = now_ts - (RETENTION["monthly"] * 30 + 1) * 86400
     removed = []
     kept = []
 
-    for gz_file in sorted(BACKUP_DIR.glob("peptide_*.sql.gz")):
-        mtime = datetime.fromtimestamp(gz_file.stat().st_mtime)
-        age_days = (now - mtime).days
-
-        # Determine if this backup should be kept
-        keep = False
-
-        # Monthly: keep 1st-of-month backups for RETENTION["monthly"] months
-        if mtime.day <= 1 and age_days <= RETENTION["monthly"] * 30:
-            keep = True
+    for entry in _scan_backups():
+        st = entry.stat()
+        mtime = st.st_mtime
+        tm = time.localtime(mtime)
 
-        # Weekly: keep Sunday backups for RETENTION["weekly"] weeks
-        elif mtime.weekday() == 6 and age_days <= RETENTION["weekly"] * 7:
-            keep = True
-
-        # Daily: keep all for RETENTION["daily"] days
-        elif age_days <= RETENTION["daily"]:
-            keep = True
+        # Monthly: 1st-of-month backups for RETENTION["monthly"] months,
+        # weekly: Sunday backups for RETENTION["weekly"] weeks,
+        # daily: everything for RETENTION["daily"] days
+        keep = ((tm.tm_mday <= 1 and mtime > monthly_cut)
+                or (tm.tm_wday == 6 and mtime > weekly_cut)
+                or mtime > daily_cut)
 
         if keep:
-            kept.append(gz_file.name)
+            kept.append(entry.name)
         else:
-            size = gz_file.stat().st_size
-            gz_file.unlink()
-            removed.append({"name": gz_file.name, "size_mb": round(size / 1024 / 1024, 2), "age_days": age_days})
+            os.unlink(entry.path)
+            age_days = int((now_ts - mtime) // 86400)
+            removed.append({"name": entry.name, "size_mb": round(st.st_size / 1024 / 1024, 2), "age_days": age_days})
 
     result = {
         "kept": len(kept),
@@ -550,9 +954,7 @@ def cleanup_old_backups() -> Dict[str, Any]:
         log.info(f"Cleanup: removed {len(removed)} old backups, freed {result['freed_mb']} MB")
 
     # Update manifest
-    manifest = _load_manifest()
-    manifest["last_cleanup"] = now.isoformat()
-    _save_manifest(manifest)
+    _touch_manifest("last_cleanup")
 
     return result
 
@@ -563,25 +965,32 @@ def cleanup_old_backups() -> Dict[str, Any]:
 
 def get_status() -> Dict[str, Any]:
     """Get backup status."""
-    backups = sorted(BACKUP_DIR.glob("peptide_*.sql.gz"), key=lambda f: f.stat().st_mtime)
-
-    local_backups = [b for b in backups if "local" in b.name]
-    prod_backups = [b for b in backups if "production" in b.name]
-
-    total_size = sum(b.stat().st_size for b in backups)
+    # One pass over the directory; no sort needed, only the newest mtime matters
+    n_local = n_prod = n_total = 0
+    total_size = 0
+    latest_l = latest_p = 0.0
+    with os.scandir(BACKUP_DIR) as it:
+        for e in it:
+            name = e.name
+            if not (name.startswith("peptide_") and name.endswith(BACKUP_SUFFIXES)):
+                continue
+            st = e.stat()
+            n_total += 1
+            total_size += st.st_size
+            if name.startswith("peptide_local_"):
+                n_local += 1
+                latest_l = max(latest_l, st.st_mtime)
+            elif name.startswith("peptide_production_"):
+                n_prod += 1
+                latest_p = max(latest_p, st.st_mtime)
 
     # Latest backup ages
-    latest_local = None
-    latest_prod = None
-    if local_backups:
-        latest_local = (datetime.now() - datetime.fromtimestamp(
-            local_backups[-1].stat().st_mtime)).total_seconds() / 3600
-    if prod_backups:
-        latest_prod = (datetime.now() - datetime.fromtimestamp(
-            prod_backups[-1].stat().st_mtime)).total_seconds() / 3600
+    now = time.time()
+    latest_local = (now - latest_l) / 3600 if n_local else None
+    latest_prod = (now - latest_p) / 3600 if n_prod else None
 
     # Health
-    if not backups:
+    if not n_total:
         health = "CRITICAL"
         msg = "NO BACKUPS EXIST!"
     elif latest_local and latest_local > 24:
@@ -595,9 +1004,9 @@ def get_status() -> Dict[str, Any]:
         "health": health,
         "message": msg,
         "counts": {
-            "total": len(backups),
-            "local": len(local_backups),
-            "production": len(prod_backups),
+            "total": n_total,
+            "local": n_local,
+            "production": n_prod,
         },
         "total_size_mb": round(total_size / 1024 / 1024, 1),
         "latest": {
@@ -611,15 +1020,16 @@ def get_status() -> Dict[str, Any]:
 
 def list_backups() -> List[Dict]:
     """List all backup files with details."""
+    now_ts = time.time()
     backups = []
-    for f in sorted(BACKUP_DIR.glob("peptide_*.sql.gz"), key=lambda x: x.stat().st_mtime, reverse=True):
+    for f in reversed(_scan_backups()):
         stat = f.stat()
         backups.append({
             "name": f.name,
             "size_mb": round(stat.st_size / 1024 / 1024, 2),
-            "date": datetime.fromtimestamp(stat.st_mtime).strftime("%Y-%m-%d %H:%M"),
-            "age_days": (datetime.now() - datetime.fromtimestamp(stat.st_mtime)).days,
-            "path": str(f),
+            "date": time.strftime("%Y-%m-%d %H:%M", time.localtime(stat.st_mtime)),
+            "age_days": int((now_ts - stat.st_mtime) // 86400),
+            "path": f.path,
         })
     return backups
 
@@ -641,6 +1051,8 @@ def main():
     parser.add_argument("--target", choices=["local", "production"], default="local",
                         help="Restore target (default: local)")
     parser.add_argument("--verify", type=str, help="Verify backup integrity")
+    parser.add_argument("--verify-all", action="store_true",
+                        help="Re-hash all backups in parallel against the manifest")
     parser.add_argument("--cleanup", action="store_true", help="Remove old backups")
     parser.add_argument("--json", action="store_true", help="JSON output")
     args = parser.parse_args()
@@ -673,8 +1085,10 @@ def main():
                 print(f"  {b['date']}  {b['name']:45s}  {b['size_mb']:>8.2f} MB  ({b['age_days']}d)")
 
     elif args.local or (not any([args.production, args.azure, args.all, args.restore,
-                                  args.restore_latest, args.verify, args.cleanup, args.status, args.list])):
+                                  args.restore_latest, args.verify, args.verify_all, args.cleanup, args.status, args.list])):
         result = backup_local_db()
+        if result["status"] == "success":
+            _drop_page_cache(result["file"])  # No upload follows
         if args.json:
             print(json.dumps(result, indent=2))
         else:
@@ -686,6 +1100,8 @@ def main():
 
     elif args.production:
         result = backup_production_db()
+        if result["status"] == "success":
+            _drop_page_cache(result["file"])
         if args.json:
             print(json.dumps(result, indent=2))
         else:
@@ -710,20 +1126,22 @@ def main():
 
     elif args.all:
         print("Running full backup cycle...")
-        r1 = backup_local_db()
-        print(f"  Local: {r1['status']} ({r1.get('size_mb', '?')} MB)")
-
-        r2 = backup_production_db()
-        print(f"  Production: {r2['status']} ({r2.get('size_mb', '?')} MB)")
-
-        # Upload local backup to Azure
-        if r1["status"] == "success":
-            r3 = upload_to_azure(r1["file"])
-            print(f"  Azure (local): {r3['status']}")
-        # Upload production backup to Azure
-        if r2["status"] == "success":
-            r4 = upload_to_azure(r2["file"])
-            print(f"  Azure (prod): {r4['status']}")
+        # Local and production dumps hit different hosts, so run them (and
+        # then their uploads) side by side
+        with ThreadPoolExecutor(max_workers=2) as ex:
+            f1 = ex.submit(backup_local_db)
+            f2 = ex.submit(backup_production_db)
+            r1, r2 = f1.result(), f2.result()
+            print(f"  Local: {r1['status']} ({r1.get('size_mb', '?')} MB)")
+            print(f"  Production: {r2['status']} ({r2.get('size_mb', '?')} MB)")
+
+            uploads = []
+            if r1["status"] == "success":
+                uploads.append(("local", ex.submit(upload_to_azure, r1["file"])))
+            if r2["status"] == "success":
+                uploads.append(("prod", ex.submit(upload_to_azure, r2["file"])))
+            for label, future in uploads:
+                print(f"  Azure ({label}): {future.result()['status']}")
 
         print("Full backup cycle complete.")
 
@@ -757,6 +1175,17 @@ def main():
             print(f"  SHA256: {result.get('sha256', '?')[:32]}...")
             print(f"  Valid SQL: {result.get('valid_sql', '?')}")
 
+    elif args.verify_all:
+        results = verify_all_backups()
+        if args.json:
+            print(json.dumps(results, indent=2))
+        else:
+            print(f"\nVerified {len(results)} backups:")
+            for r in results:
+                print(f"  {r['status']:10s}  {r['name']}")
+        if any(r["status"] == "mismatch" for r in results):
+            sys.exit(1)
+
     elif args.cleanup:
         result = cleanup_old_backups()
         if args.json: